@@ -173,7 +173,7 @@ class GPR:
         """Removes the plugin menu item and icon from QGIS GUI."""
         for action in self.actions:
             self.iface.removePluginMenu(
-                self.tr(u'&GPR'),
+                self.menu,
                 action)
             self.iface.removeToolBarIcon(action)
 
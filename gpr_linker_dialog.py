@@ -23,7 +23,7 @@
 """
 
 import os
-from qgis.core import QgsProject, QgsRasterLayer, QgsLayerTreeGroup, QgsLayerTreeLayer
+from qgis.core import Qgis, QgsMessageLog, QgsProject, QgsRasterLayer, QgsLayerTreeGroup, QgsLayerTreeLayer
 from qgis.PyQt import QtWidgets, uic, QtCore
 from qgis.PyQt.QtWidgets import QInputDialog, QFileDialog
 from PyQt5.QtGui import QStandardItem, QStandardItemModel
@@ -34,8 +34,14 @@ from PyQt5.QtGui import QStandardItem, QStandardItemModel
 FORM_CLASS, _ = uic.loadUiType(os.path.join(
     os.path.dirname(__file__), 'gpr_linker_dialog_base.ui'))
 
+# Tag della scheda del pannello Log Messages in cui vengono scritti i messaggi del plugin
+LOG_TAG = 'GPR'
+
 
 class GPRDialog(QtWidgets.QDialog, FORM_CLASS):
+
+    # Filtro dei file raster proposti dalla finestra di selezione
+    RASTER_FILE_FILTER = "Raster files (*.tif *.tiff *.png *.jpg)"
     
     def __init__(self, parent=None):
         """Constructor."""
@@ -56,68 +62,76 @@ class GPRDialog(QtWidgets.QDialog, FORM_CLASS):
         # Find the dial in the dialog layout
         self.dial = self.findChild(QtWidgets.QDial, "dial")
         self.dial.setEnabled(False)  # Disable the dial initially
+        # Cache (group_name, layer_nodes) of the selected group, reset on layer tree changes
+        self.layer_nodes_cache = None
+        # Id of the layer made visible by the last dial step (an id string cannot
+        # go stale when QGIS deletes and reallocates layer tree nodes)
+        self.visible_layer_id = None
+        # Throttle dial movements: while the dial is turning, apply at most one
+        # update every 16 ms (~60 Hz), always using the dial's latest value
+        self.dial_timer = QtCore.QTimer(self)
+        self.dial_timer.setSingleShot(True)
+        self.dial_timer.setInterval(16)
 
         """Connessione dei segnali agli slot"""
         # Connect the "Sfoglia" button
         self.Sfoglia.clicked.connect(self.browse_rasters)
-        # Connect the valueChanged signal of the dial to the toggle_raster_visibility method
-        self.dial.valueChanged.connect(self.toggle_raster_visibility)
+        # Connect the valueChanged signal of the dial to the debounce timer; on timeout a
+        # single slot resolves the selected group once and updates visibility and label
+        self.dial.valueChanged.connect(self.on_dial_value_changed)
+        self.dial_timer.timeout.connect(self.apply_dial_value)
         # Connect the signal for the checkbox state change
         self.listView.clicked.connect(self.toggle_group_visibility)
+        # Invalidate the cached layer nodes whenever the layer tree changes
+        tree_root = QgsProject.instance().layerTreeRoot()
+        tree_root.addedChildren.connect(self.invalidate_layer_nodes_cache)
+        tree_root.removedChildren.connect(self.invalidate_layer_nodes_cache)
+        tree_root.nameChanged.connect(self.invalidate_layer_nodes_cache)
 
 
-        """Popolazione iniziale della lista dei gruppi"""
-        # Populate the group list initially
-        self.populate_group_list()  # Call the method here
-
         """Popolazione della lista delle checkbox dei gruppi"""
-        # Populate the group checkbox list after populating the group list
+        # Populate the group checkbox list
         self.populate_group_checkbox_list()  # Call the method here
 
-        self.plugin_created_groups = []
-
-        """Popolazione della lista dei gruppi creati dal plugin"""
-        # Call traverse_layer_tree to populate plugin_created_groups list
-        root = QgsProject.instance().layerTreeRoot()
-        self.traverse_layer_tree(root)
-
          #connesso al populate group list widget
         self.listView.clicked.connect(self.on_group_list_item_clicked)
 
-        # Connetti il segnale valueChanged del dial al metodo update_raster_label
-        self.dial.valueChanged.connect(self.update_raster_label)
-
-    def populate_group_list(self):
-        print("Populating group list...")
-        # Ottieni il modello esistente
-        model = self.list_model
-
-        # Rimuovi tutte le righe esistenti per evitare duplicati
-        model.removeRows(0, model.rowCount())
-        root = QgsProject.instance().layerTreeRoot()
-
-        if root:
-            for child in root.children():
-                if isinstance(child, QgsLayerTreeGroup):
-                    print(f"Found group: {child.name()}")
-                    item = QStandardItem(child.name())
-                    model.appendRow(item)
-
-        # Aggiorna esplicitamente la lista per visualizzare i nuovi dati
-        self.listView.setModel(model)
-        print("End populating group list...")  # Aggiornamento esplicito della lista per visualizzare i nuovi dati
-
-
     def populate_group_checkbox_list(self):
-        """Populate the QListView with checkboxes for each group in the TOC."""
+        """Populate the QListView with checkboxes for each group in the TOC.
+
+        The checked groups and the selected group are restored after the
+        rebuild, as long as they still exist in the TOC.
+        """
+        # Ricorda i gruppi spuntati e quello selezionato prima di svuotare il modello
+        checked_names = set()
+        for row in range(self.list_model.rowCount()):
+            item = self.list_model.item(row)
+            if item.checkState() == QtCore.Qt.Checked:
+                checked_names.add(item.text())
+        selected_index = self.listView.selectedIndexes()
+        selected_name = selected_index[0].data() if selected_index else None
+
         root = QgsProject.instance().layerTreeRoot()
         self.list_model.clear()  # Clear the model
 
+        items = []
+        selected_row = None
         for child in root.children():
             if isinstance(child, QgsLayerTreeGroup):
                 item = QStandardItem(child.name())
                 item.setCheckable(True)  # Make the item checkable
-                self.list_model.appendRow(item)
+                if child.name() in checked_names:
+                    item.setCheckState(QtCore.Qt.Checked)
+                if selected_row is None and child.name() == selected_name:
+                    selected_row = len(items)
+                items.append(item)
+        # Append all rows at once so the view is notified a single time
+        self.list_model.invisibleRootItem().appendRows(items)
+
+        if selected_row is not None:
+            self.listView.selectionModel().setCurrentIndex(
+                self.list_model.index(selected_row, 0),
+                QtCore.QItemSelectionModel.ClearAndSelect)
 
     def load_rasters_into_group(self, raster_files, group_name):
         # Load raster files into the specified group.
@@ -127,16 +141,23 @@ class GPRDialog(QtWidgets.QDialog, FORM_CLASS):
             # If the group doesn't exist, create it
             group = QgsLayerTreeGroup(group_name)
             QgsProject.instance().layerTreeRoot().addChildNode(group)
-            self.plugin_created_groups.append(group_name)
 
+        layers = []
         for file in raster_files:
             layer = QgsRasterLayer(file, os.path.basename(file))
             if layer.isValid():
-                QgsProject.instance().addMapLayer(layer, False) #Questa stringa inserisce i raster direttamente nella TOC
-                layer_node = QgsLayerTreeLayer(layer)
-                group.insertChildNode(0, QgsLayerTreeLayer(layer))
+                layers.append(layer)
             else:
-                print(f"Unable to load raster file: {file}")
+                QgsMessageLog.logMessage(f"Unable to load raster file: {file}", LOG_TAG, Qgis.Warning)
+
+        # Registra tutti i raster nel progetto in un'unica chiamata, senza aggiungerli alla TOC
+        QgsProject.instance().addMapLayers(layers, False)
+        layer_nodes = [QgsLayerTreeLayer(layer) for layer in layers]
+
+        # Insert all the nodes with a single layer tree mutation; reversed so the
+        # last selected file stays on top, as when inserting them one by one
+        if layer_nodes:
+            group.insertChildNodes(0, layer_nodes[::-1])
 
 
     def toggle_group_visibility(self, index):
@@ -151,105 +172,117 @@ class GPRDialog(QtWidgets.QDialog, FORM_CLASS):
                 self.dial.setEnabled(False)
 
 
-    def toggle_raster_visibility(self, value):
-        """Toggle raster visibility based on the dial value."""
+    def selected_group_layer_nodes(self):
+        """Return the layer nodes of the group selected in the list view.
+
+        Returns None (after logging the reason) when no group is selected,
+        the group does not exist or it contains no raster layers.
+        """
         selected_index = self.listView.selectedIndexes()
-        if selected_index:
-            group_name = selected_index[0].data()
-            group = QgsProject.instance().layerTreeRoot().findGroup(group_name)
-            if group:
-                layer_nodes = [child for child in group.children() if isinstance(child, QgsLayerTreeLayer)]
-                if layer_nodes:
-                    # Disable the previous raster
-                    previous_index = value - 1 if value > 0 else len(layer_nodes) - 1
-                    if previous_index < len(layer_nodes):
-                        previous_layer_node = layer_nodes[previous_index]
-                        previous_layer_node.setItemVisibilityChecked(False)
-
-                    # Enable the current raster
-                    current_index = value
-                    if current_index < len(layer_nodes):
-                        current_layer_node = layer_nodes[current_index]
-                        current_layer_node.setItemVisibilityChecked(True)
-                else:
-                    print("No raster layers in the selected group.")
-            else:
-                print(f"No group found with name: {group_name}")
-        else:
-            print("No group selected.")
+        if not selected_index:
+            QgsMessageLog.logMessage("No group selected.", LOG_TAG, Qgis.Info)
+            return None
+        group_name = selected_index[0].data()
+        if self.layer_nodes_cache is not None and self.layer_nodes_cache[0] == group_name:
+            return self.layer_nodes_cache[1]
+        group = QgsProject.instance().layerTreeRoot().findGroup(group_name)
+        if not group:
+            QgsMessageLog.logMessage(f"No group found with name: {group_name}", LOG_TAG, Qgis.Warning)
+            return None
+        layer_nodes = [child for child in group.children() if isinstance(child, QgsLayerTreeLayer)]
+        if not layer_nodes:
+            QgsMessageLog.logMessage("No raster layers in the selected group.", LOG_TAG, Qgis.Info)
+            return None
+        self.layer_nodes_cache = (group_name, layer_nodes)
+        return layer_nodes
+
+
+    def invalidate_layer_nodes_cache(self, *args):
+        # Svuota la cache dei nodi quando l'albero dei layer viene modificato
+        self.layer_nodes_cache = None
+
+
+    def on_dial_value_changed(self, value):
+        # Non riavviare il timer se è già in corso: durante una rotazione continua
+        # il dial viene aggiornato ogni 16 ms invece di attendere che si fermi
+        if not self.dial_timer.isActive():
+            self.dial_timer.start()
+
+
+    def apply_dial_value(self):
+        # Risolve il gruppo selezionato una sola volta per ogni movimento del dial
+        value = self.dial.value()
+        layer_nodes = self.selected_group_layer_nodes()
+        if layer_nodes:
+            # Nothing to do if the raster for this value is already the one shown
+            # and has not been unchecked in the TOC in the meantime
+            if (value < len(layer_nodes)
+                    and layer_nodes[value].layerId() == self.visible_layer_id
+                    and layer_nodes[value].itemVisibilityChecked()):
+                return
+            self.toggle_raster_visibility(value, layer_nodes)
+            self.update_raster_label(value, layer_nodes)
+
+
+    def toggle_raster_visibility(self, value, layer_nodes=None):
+        """Toggle raster visibility based on the dial value."""
+        if layer_nodes is None:
+            layer_nodes = self.selected_group_layer_nodes()
+        if layer_nodes and value < len(layer_nodes):
+            # Show only the current raster. One update may cover several dial
+            # steps, so every other raster of the group is hidden, not just the
+            # adjacent one; QGIS ignores calls that do not change the state
+            for index, layer_node in enumerate(layer_nodes):
+                layer_node.setItemVisibilityChecked(index == value)
+            self.visible_layer_id = layer_nodes[value].layerId()
         
 
     def update_dial_range(self):
         #Update the range of the dial based on the number of raster layers in the selected group.
-        selected_index = self.listView.selectedIndexes()
-        if selected_index:
-            group_name = selected_index[0].data()
-            group = QgsProject.instance().layerTreeRoot().findGroup(group_name)
-            if group:
-                layer_nodes = [child for child in group.children() if isinstance(child, QgsLayerTreeLayer)]
-                if layer_nodes:
-                    self.dial.setRange(0, len(layer_nodes) - 1)
-                else:
-                    print("No raster layers in the selected group.")
-            else:
-                print(f"No group found with name: {group_name}")
-        else:
-            print("No group selected.")
+        layer_nodes = self.selected_group_layer_nodes()
+        if layer_nodes:
+            self.dial.setRange(0, len(layer_nodes) - 1)
 
 
     def browse_rasters(self):
         # Open the file dialog to select raster files.
-        files, _ = QFileDialog.getOpenFileNames(self, "Select raster files", "/", "Raster files (*.tif *.tiff *.png *.jpg)")
+        files, _ = QFileDialog.getOpenFileNames(self, "Select raster files", "/", self.RASTER_FILE_FILTER)
         if files:
-            print("Selected raster files:", files)
+            QgsMessageLog.logMessage(f"Selected raster files: {files}", LOG_TAG, Qgis.Info)
             # Open a dialog to input the group name
             group_name, ok = QInputDialog.getText(self, "Enter Group Name", "Group Name:")
             if ok:
                 # Call load_rasters_into_group after importing the raster files
                 self.load_rasters_into_group(files, group_name)
-                # Update the group list after loading the raster files
+                # Update the group list after loading the raster files, keeping
+                # the checked groups and the selection
                 self.populate_group_checkbox_list()
                 # Set the range of the dial based on the number of raster layers in the group
                 self.update_dial_range()
 
         # Funzione per caricare i raster in un gruppo specificato
 
-    # Funzione per alternare la visibilità dei raster all'interno del gruppo
-    def traverse_layer_tree(self, node):
-        # Recursive method to traverse all groups in the layer tree
-        if isinstance(node, QgsLayerTreeGroup):
-            group_name = node.name()
-            if group_name not in self.plugin_created_groups:
-                self.plugin_created_groups.append(group_name)
-            for child in node.children():
-                self.traverse_layer_tree(child)
-
-
     def on_group_list_item_clicked(self, index):
         # Gestisce l'evento del clic sugli elementi della lista
         item = self.list_model.itemFromIndex(index)
         if item is not None:
             selected_group_name = item.text()
-            print("Selected group:", selected_group_name)
+            QgsMessageLog.logMessage(f"Selected group: {selected_group_name}", LOG_TAG, Qgis.Info)
 
 
-    def update_raster_label(self, value):
+    def update_raster_label(self, value, layer_nodes=None):
         # Metodo per aggiornare il testo del QLabel con il nome del raster corrente
-        selected_index = self.listView.selectedIndexes()
-        if selected_index:
-            group_name = selected_index[0].data()
-            group = QgsProject.instance().layerTreeRoot().findGroup(group_name)
-            if group:
-                layer_nodes = [child for child in group.children() if isinstance(child, QgsLayerTreeLayer)]
-                if layer_nodes:
-                    # Ottieni il nome del raster corrente basato sul valore del dial
-                    current_index = value
-                    if current_index < len(layer_nodes):
-                        current_layer_node = layer_nodes[current_index]
-                        # Accedi direttamente al layer all'interno di QgsLayerTreeLayer
-                        raster_layer = current_layer_node.layer()
-                        if raster_layer:
-                            # Ottieni il nome del layer raster
-                            raster_name = raster_layer.name()
-                            # Aggiorna il testo del QLabel con il nome del raster corrente
-                            self.nomeraster.setText(raster_name)
\ No newline at end of file
+        if layer_nodes is None:
+            layer_nodes = self.selected_group_layer_nodes()
+        if layer_nodes:
+            # Ottieni il nome del raster corrente basato sul valore del dial
+            current_index = value
+            if current_index < len(layer_nodes):
+                current_layer_node = layer_nodes[current_index]
+                # Accedi direttamente al layer all'interno di QgsLayerTreeLayer
+                raster_layer = current_layer_node.layer()
+                if raster_layer:
+                    # Ottieni il nome del layer raster
+                    raster_name = raster_layer.name()
+                    # Aggiorna il testo del QLabel con il nome del raster corrente
+                    self.nomeraster.setText(raster_name)
\ No newline at end of file